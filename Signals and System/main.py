@@ -9,16 +9,21 @@ generates a PDF file containing all the images.
 """
 
 import os
-import requests
+import asyncio
+import aiohttp
 import re
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 import img2pdf
 from io import BytesIO
 from PIL import Image
 import logging
 import base64
+import functools
+import hashlib
+import shutil
 from urllib.parse import urljoin, urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -26,6 +31,7 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
 # Configure logging
@@ -35,6 +41,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Image URL schemes that cannot be downloaded
+_SKIP_PREFIXES = ('data:', 'blob:', 'javascript:')
+
+
+@functools.lru_cache(maxsize=1)
+def _driver_path():
+    """Return the chromedriver path, resolving it at most once per process."""
+    # An explicitly configured driver avoids the webdriver-manager lookup entirely
+    env_path = os.environ.get("CHROMEDRIVER")
+    if env_path:
+        return env_path
+    return ChromeDriverManager().install()
+
 class WeChatImageScraper:
     """Scrapes images from WeChat public account articles and creates PDFs."""
     
@@ -50,10 +69,12 @@ class WeChatImageScraper:
         self.url = url
         self.output_dir = output_dir
         self.pdf_name = pdf_name
+        self.cache_dir = os.path.join(output_dir, ".cache")
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
         self.driver = None
+        self._sem = None
         
         # Create output directory if it doesn't exist
         if not os.path.exists(output_dir):
@@ -68,9 +89,12 @@ class WeChatImageScraper:
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_argument("--disable-sync")
             chrome_options.add_argument(f"user-agent={self.headers['User-Agent']}")
             
-            service = Service(ChromeDriverManager().install())
+            service = Service(_driver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             logger.info("Successfully set up Chrome webdriver")
             return True
@@ -97,9 +121,84 @@ class WeChatImageScraper:
             logger.error(f"Error loading article: {e}")
             return False
     
-    def scroll_to_load_images(self):
-        """Scroll through the page to ensure all lazy-loaded images are loaded."""
+    def _watch_lazy_load(self):
+        """
+        Install a MutationObserver that flags the page as idle.
+        
+        ``window.__lazyIdle`` becomes true once the DOM has not changed for
+        500 ms and is cleared again by every mutation.
+        """
+        self.driver.execute_script("""
+            if (window.__lazyObserver) {
+                window.__lazyObserver.disconnect();
+            }
+            var timer = null;
+            window.__lazyReset = function() {
+                window.__lazyIdle = false;
+                clearTimeout(timer);
+                timer = setTimeout(function() { window.__lazyIdle = true; }, 500);
+            };
+            window.__lazyObserver = new MutationObserver(window.__lazyReset);
+            window.__lazyObserver.observe(document.body,
+                {childList: true, subtree: true, attributes: true});
+            window.__lazyReset();
+        """)
+    
+    def _wait_for_script(self, script, deadline, timeout=None):
+        """
+        Poll a JavaScript condition until it returns true or the wait expires.
+        
+        Args:
+            script (str): JavaScript returning a boolean
+            deadline (float): ``time.monotonic()`` value after which to stop waiting
+            timeout (float): Optional cap in seconds on this wait alone
+        """
+        remaining = deadline - time.monotonic()
+        if timeout is not None:
+            remaining = min(remaining, timeout)
+        if remaining <= 0:
+            return
+        
         try:
+            WebDriverWait(self.driver, remaining, poll_frequency=0.1).until(
+                lambda d: d.execute_script(script)
+            )
+        except TimeoutException:
+            logger.warning("Timed out waiting for lazy-loaded images")
+    
+    def _wait_for_images(self, deadline, settle=0.1, timeout=2):
+        """
+        Wait for the images in the viewport after the last scroll to finish loading.
+        
+        Args:
+            deadline (float): ``time.monotonic()`` value after which to stop waiting
+            settle (float): Minimum wait so lazy loaders can swap in the real ``src``
+            timeout (float): Maximum time to wait for this step in seconds
+        """
+        # The settle time is reserved in the overall budget, so it always runs
+        time.sleep(settle)
+        self._wait_for_script(
+            "return Array.from(document.images).every(function(i) {"
+            "    var r = i.getBoundingClientRect();"
+            "    return i.complete || r.top >= window.innerHeight || r.bottom <= 0;"
+            "})",
+            deadline, timeout
+        )
+    
+    def scroll_to_load_images(self, max_wait=8, settle=0.1):
+        """
+        Scroll through the page to ensure all lazy-loaded images are loaded.
+        
+        Args:
+            max_wait (float): Upper bound in seconds on the total time spent waiting
+            settle (float): Minimum wait after each scroll step
+        """
+        try:
+            # 5 bottom scrolls plus 10 gradual steps at most, each of which
+            # settles for ``settle`` seconds on top of the shared deadline
+            deadline = time.monotonic() + max_wait - 15 * settle
+            self._watch_lazy_load()
+            
             # Get scroll height
             last_height = self.driver.execute_script("return document.body.scrollHeight")
             
@@ -108,7 +207,7 @@ class WeChatImageScraper:
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                 
                 # Wait to load page
-                time.sleep(2)
+                self._wait_for_images(deadline, settle)
                 
                 # Calculate new scroll height and compare with last scroll height
                 new_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -123,8 +222,12 @@ class WeChatImageScraper:
             height = self.driver.execute_script("return document.body.scrollHeight")
             for i in range(10):
                 self.driver.execute_script(f"window.scrollTo(0, {height * i / 10});")
-                time.sleep(0.5)
+                self._wait_for_images(deadline, settle)
+            
+            # Wait once for the DOM to go quiet before images are extracted
+            self._wait_for_script("return window.__lazyIdle", deadline)
             
+            self.driver.execute_script("window.__lazyObserver.disconnect();")
             logger.info("Scrolled through page to load all images")
             return True
         except Exception as e:
@@ -136,154 +239,340 @@ class WeChatImageScraper:
         Extract images directly using Selenium.
         
         Returns:
-            list: List of image URLs found in the article
+            list: ``(url, width, height)`` tuples for the images found in the
+                article; width and height are 0 when not known
         """
         try:
-            # Execute JavaScript to find all images in the article
+            # Execute JavaScript to find all images in the article in a single
+            # pass over the candidate elements, in document order
             js_script = """
             var images = [];
-            // Regular img tags
-            var imgElements = document.querySelectorAll('img');
-            imgElements.forEach(function(img) {
-                // Skip small images (likely icons)
-                if (img.width >= 100 && img.height >= 100) {
-                    var src = img.src || img.getAttribute('data-src') || img.getAttribute('data-original');
-                    if (src) {
-                        images.push({
-                            url: src,
-                            width: img.width,
-                            height: img.height
-                        });
-                    }
+            var seen = new Set();
+            var bgRe = /url\(['"]?(.*?)['"]?\)/;
+            function addImage(url, width, height) {
+                if (url && !seen.has(url)) {
+                    seen.add(url);
+                    images.push({url: url, width: width || 0, height: height || 0});
                 }
-            });
-            
-            // WeChat specific: data-src attributes are commonly used
-            var wechatImgs = document.querySelectorAll('[data-src]');
-            wechatImgs.forEach(function(img) {
-                var dataSrc = img.getAttribute('data-src');
-                if (dataSrc && !images.some(i => i.url === dataSrc)) {
-                    images.push({
-                        url: dataSrc,
-                        width: img.width || 0,
-                        height: img.height || 0
-                    });
+            }
+            function knownSize(element, url) {
+                // The loaded size only applies to the URL the img is showing;
+                // lazy images show a 1x1 placeholder until their data-src loads
+                if (element.tagName === 'IMG' && element.complete && element.naturalWidth &&
+                        url === (element.currentSrc || element.src)) {
+                    return [element.naturalWidth, element.naturalHeight];
                 }
-            });
-            
-            // Sometimes images are in background-image CSS
-            var elementsWithBackgroundImg = document.querySelectorAll('*');
-            elementsWithBackgroundImg.forEach(function(element) {
-                var style = window.getComputedStyle(element);
-                var backgroundImage = style.backgroundImage;
+                // WeChat records the real width and height/width ratio
+                var dataWidth = parseFloat(element.getAttribute('data-w'));
+                var dataRatio = parseFloat(element.getAttribute('data-ratio'));
+                if (dataWidth > 0 && dataRatio > 0) {
+                    return [dataWidth, Math.round(dataWidth * dataRatio)];
+                }
+                return [0, 0];
+            }
+            function addElementImage(element, url) {
+                if (url) {
+                    var size = knownSize(element, url);
+                    addImage(url, size[0], size[1]);
+                }
+            }
+            function addBackgroundImage(element) {
+                var backgroundImage = window.getComputedStyle(element).backgroundImage;
                 if (backgroundImage && backgroundImage !== 'none') {
-                    var match = backgroundImage.match(/url\(['"]?(.*?)['"]?\)/);
-                    if (match && match[1]) {
-                        var url = match[1];
-                        // Only include if it's a reasonable size element
-                        if (element.offsetWidth >= 100 && element.offsetHeight >= 100) {
-                            images.push({
-                                url: url,
-                                width: element.offsetWidth,
-                                height: element.offsetHeight
-                            });
-                        }
+                    var match = backgroundImage.match(bgRe);
+                    // Only include if it's a reasonable size element
+                    if (match && match[1] && element.offsetWidth >= 100 && element.offsetHeight >= 100) {
+                        addImage(match[1], element.offsetWidth, element.offsetHeight);
                     }
                 }
+            }
+            
+            var elements = document.querySelectorAll('img, [data-src], [style*="background"]');
+            elements.forEach(function(element) {
+                // Regular img tags, skipping small images (likely icons)
+                if (element.tagName === 'IMG' && element.width >= 100 && element.height >= 100) {
+                    addElementImage(element,
+                        element.src || element.getAttribute('data-src') || element.getAttribute('data-original'));
+                }
+                
+                // WeChat specific: data-src attributes are commonly used
+                addElementImage(element, element.getAttribute('data-src'));
+                
+                // Inline background-image CSS
+                if (element.style.backgroundImage) {
+                    addBackgroundImage(element);
+                }
             });
             
+            // Computing styles for every element is expensive, so only fall
+            // back to it when nothing else was found
+            if (images.length === 0) {
+                document.querySelectorAll('*').forEach(addBackgroundImage);
+            }
+            
             return images;
             """
             
             image_data = self.driver.execute_script(js_script)
             
             # Process and filter image URLs
-            image_urls = []
+            parsed_url = urlparse(self.url)
+            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+            seen = set()
+            images = []
             for img in image_data:
                 url = img.get('url', '')
                 
-                # Skip data URLs
-                if url.startswith('data:'):
+                # Skip inline and script URLs
+                if not url or url.startswith(_SKIP_PREFIXES):
                     continue
                     
                 # Handle relative URLs
                 if url.startswith('//'):
                     url = 'https:' + url
-                elif not (url.startswith('http://') or url.startswith('https://')):
+                elif not url.startswith(('http://', 'https://')):
                     if url.startswith('/'):
-                        parsed_url = urlparse(self.url)
-                        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
                         url = base_url + url
                     else:
                         url = urljoin(self.url, url)
                 
                 # Add to list if not already there
-                if url and url not in image_urls:
-                    image_urls.append(url)
+                if url and url not in seen:
+                    seen.add(url)
+                    images.append((url, img.get('width', 0), img.get('height', 0)))
             
-            logger.info(f"Found {len(image_urls)} images in the article using Selenium")
-            return image_urls
+            logger.info(f"Found {len(images)} images in the article using Selenium")
+            return images
             
         except Exception as e:
             logger.error(f"Error extracting images with Selenium: {e}")
             return []
     
-    def download_images(self, image_urls):
+    async def _afetch(self, session, pool, url, filepath, retries=3, backoff=0.5):
         """
-        Download images from the extracted URLs.
+        Fetch a single image and save it, retrying on rate limits.
         
         Args:
-            image_urls (list): List of image URLs to download
+            session (aiohttp.ClientSession): Shared HTTP session
+            pool (ThreadPoolExecutor): Pool for CPU-bound image conversion
+            url (str): URL of the image
+            filepath (str): Path to save the image to
+            retries (int): Number of retries on 429/5xx responses
+            backoff (float): Initial backoff delay in seconds, doubled per retry
             
         Returns:
-            list: Paths to the downloaded image files
+            str: Path to the saved image file, or None if it was skipped
         """
-        if not image_urls:
-            return []
+        for attempt in range(retries + 1):
+            async with self._sem:
+                async with session.get(url) as response:
+                    if response.status in (429, 500, 502, 503, 504) and attempt < retries:
+                        logger.warning(f"Got HTTP {response.status} for {url}, retrying")
+                    else:
+                        response.raise_for_status()
+                        return await self._astream_image(response, pool, url, filepath)
             
-        downloaded_images = []
+            # Back off outside the semaphore so other downloads can proceed
+            await asyncio.sleep(backoff * 2 ** attempt)
+    
+    async def _astream_image(self, response, pool, url, filepath, head_size=65536):
+        """
+        Stream an image response to disk, checking its size from the header first.
+        
+        Only the first ``head_size`` bytes are read to determine the image
+        dimensions, so images that are too small are dropped without
+        downloading the rest. RGB and grayscale JPEGs are written to disk
+        as received; other formats are converted to JPEG in the thread pool.
         
-        for i, url in enumerate(image_urls):
+        Args:
+            response (aiohttp.ClientResponse): Open response for the image
+            pool (ThreadPoolExecutor): Pool for CPU-bound image conversion
+            url (str): URL of the image
+            filepath (str): Path to save the image to
+            head_size (int): Number of bytes to read for the header check
+            
+        Returns:
+            str: Path to the saved image file, or None if it was skipped
+        """
+        head = b''
+        while len(head) < head_size:
+            chunk = await response.content.read(head_size - len(head))
+            if not chunk:
+                break
+            head += chunk
+        
+        try:
+            # Image.open only parses the header, the pixel data is not decoded
+            img = Image.open(BytesIO(head))
+        except Exception:
+            # Large metadata blocks can push the header past head_size
+            head += await response.content.read()
             try:
-                logger.info(f"Downloading image {i+1}/{len(image_urls)}: {url}")
-                
-                # Try screenshot method if traditional download fails
-                try:
-                    response = requests.get(url, headers=self.headers, timeout=30)
-                    response.raise_for_status()
-                    image_content = response.content
-                except:
-                    logger.warning(f"Failed to download image via requests, trying alternative method")
-                    continue
-                
-                try:
-                    # Try to open as image to verify it's valid
-                    img = Image.open(BytesIO(image_content))
-                    
-                    # Skip too small images (likely icons, buttons, etc.)
-                    if img.width < 100 or img.height < 100:
-                        logger.warning(f"Skipping small image: {img.width}x{img.height}")
-                        continue
-                        
-                    # Generate filename and path
-                    filename = f"image_{i+1:03d}.jpg"
-                    filepath = os.path.join(self.output_dir, filename)
-                    
-                    # Convert to RGB if needed and save
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    img.save(filepath, 'JPEG')
-                    
-                    downloaded_images.append(filepath)
-                    logger.info(f"Saved image to {filepath}")
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to process image from {url}: {e}")
-                    continue
-                
+                img = Image.open(BytesIO(head))
             except Exception as e:
-                logger.error(f"Error downloading image {url}: {e}")
+                logger.warning(f"Failed to process image from {url}: {e}")
+                return None
+        
+        # Skip too small images (likely icons, buttons, etc.)
+        if img.width < 100 or img.height < 100:
+            logger.warning(f"Skipping small image: {img.width}x{img.height}")
+            response.close()
+            return None
+        
+        loop = asyncio.get_running_loop()
+        if img.format != 'JPEG' or img.mode not in ('RGB', 'L'):
+            # Needs conversion, which is CPU-bound, keep it off the event loop
+            image_content = head + await response.content.read()
+            return await loop.run_in_executor(pool, self._save_image, url, image_content, filepath)
+        
+        # Disk writes go through the thread pool so they don't block other downloads
+        f = await loop.run_in_executor(pool, open, filepath, 'wb')
+        try:
+            await loop.run_in_executor(pool, f.write, head)
+            async for chunk in response.content.iter_chunked(head_size):
+                await loop.run_in_executor(pool, f.write, chunk)
+        finally:
+            await loop.run_in_executor(pool, f.close)
+        
+        return filepath
+    
+    def _save_image(self, url, image_content, filepath):
+        """
+        Validate downloaded image bytes and save them as an RGB JPEG.
+        
+        Args:
+            url (str): URL the image was downloaded from
+            image_content (bytes): Raw image data
+            filepath (str): Path to save the image to
+            
+        Returns:
+            str: Path to the saved image file, or None if it was skipped
+        """
+        try:
+            # Try to open as image to verify it's valid
+            img = Image.open(BytesIO(image_content))
+            
+            # Let libjpeg decode large JPEGs at a reduced scale (no-op otherwise)
+            img.draft('RGB', (2048, 2048))
+            
+            # Skip too small images (likely icons, buttons, etc.)
+            if img.width < 100 or img.height < 100:
+                logger.warning(f"Skipping small image: {img.width}x{img.height}")
+                return None
+                
+            # Convert to RGB if needed and save
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            img.save(filepath, 'JPEG', quality=90, optimize=False)
+            return filepath
+            
+        except Exception as e:
+            logger.warning(f"Failed to process image from {url}: {e}")
+            return None
+    
+    @staticmethod
+    def _link_or_copy(src, dst):
+        """Hard-link ``src`` to ``dst``, falling back to a copy across filesystems."""
+        if os.path.exists(dst):
+            os.remove(dst)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+    
+    async def _afetch_and_save(self, session, pool, i, url):
+        """
+        Download a single image through the on-disk cache.
+        
+        Images are cached under ``.cache`` in the output directory, keyed by
+        the SHA-1 of their URL, so repeated runs skip the network entirely.
+        Failures are logged rather than raised.
+        
+        Args:
+            session (aiohttp.ClientSession): Shared HTTP session
+            pool (ThreadPoolExecutor): Pool for CPU-bound image conversion
+            i (int): Index of the image in the article
+            url (str): URL of the image
+            
+        Returns:
+            str: Path to the saved image file, or None if it was skipped
+        """
+        filepath = os.path.join(self.output_dir, f"image_{i+1:03d}.jpg")
+        cache_path = os.path.join(self.cache_dir, hashlib.sha1(url.encode()).hexdigest() + ".jpg")
+        
+        # Download to a temporary name so interrupted downloads are never cached
+        part_path = cache_path + ".part"
+        try:
+            if os.path.exists(cache_path):
+                self._link_or_copy(cache_path, filepath)
+                logger.info(f"Using cached image {i+1} for {url}")
+                return filepath
+            
+            logger.info(f"Downloading image {i+1}: {url}")
+            try:
+                if not await self._afetch(session, pool, url, part_path):
+                    return None
+                os.replace(part_path, cache_path)
+            finally:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+            
+            self._link_or_copy(cache_path, filepath)
+            logger.info(f"Saved image to {filepath}")
+            return filepath
+            
+        except Exception as e:
+            logger.warning(f"Failed to download image {url}: {e}")
+            return None
+    
+    async def _adownload_all(self, urls):
+        """
+        Download all images over a single HTTP session.
+        
+        Args:
+            urls (list): List of image URLs to download
+            
+        Returns:
+            list: Saved file path (or None) for each URL, in input order
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._sem = asyncio.Semaphore(8)
+        connector = aiohttp.TCPConnector(limit=16, limit_per_host=8, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=30)
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            async with aiohttp.ClientSession(connector=connector, headers=self.headers,
+                                             timeout=timeout) as session:
+                return await asyncio.gather(
+                    *(self._afetch_and_save(session, pool, i, url) for i, url in enumerate(urls))
+                )
+    
+    def download_images(self, images):
+        """
+        Download images from the extracted URLs concurrently.
+        
+        Args:
+            images (list): ``(url, width, height)`` tuples of images to download
+            
+        Returns:
+            list: Paths to the downloaded image files, in article order
+        """
+        # Skip images the page already reports as too small (likely icons);
+        # unknown sizes are checked after the image header is downloaded
+        image_urls = []
+        for url, width, height in images:
+            if width > 0 and height > 0 and (width < 100 or height < 100):
+                logger.info(f"Skipping small image: {width}x{height} {url}")
                 continue
+            image_urls.append(url)
+        
+        if not image_urls:
+            return []
+            
+        logger.info(f"Downloading {len(image_urls)} images")
+        
+        results = asyncio.run(self._adownload_all(image_urls))
+        downloaded_images = [filepath for filepath in results if filepath]
         
         # If no images were downloaded via normal means, try taking screenshots
         if not downloaded_images and self.driver:
@@ -295,8 +584,14 @@ class WeChatImageScraper:
         
         return downloaded_images
     
+    @staticmethod
+    def _write_file(filepath, data):
+        """Write bytes to a file."""
+        with open(filepath, 'wb') as f:
+            f.write(data)
+    
     def capture_article_screenshots(self):
-        """Capture article content via screenshots as a fallback method."""
+        """Capture article content via a full-page screenshot as a fallback method."""
         screenshot_paths = []
         
         try:
@@ -310,33 +605,82 @@ class WeChatImageScraper:
                 
             main_element = article_elements[0]
             
-            # Get the height and set a reasonable viewport
-            total_height = main_element.size['height']
-            viewport_height = 1000  # A reasonable chunk size
+            rect = main_element.rect
+            page_height = 1000  # A reasonable page size
             
-            # Take screenshots in chunks
-            for i in range(0, total_height, viewport_height):
-                # Scroll to position
-                self.driver.execute_script(f"window.scrollTo(0, {i});")
-                time.sleep(0.5)  # Give time for rendering
-                
-                # Take screenshot
-                screenshot = self.driver.get_screenshot_as_png()
-                img = Image.open(BytesIO(screenshot))
-                
-                # Save screenshot
-                filepath = os.path.join(self.output_dir, f"screenshot_{i//viewport_height:03d}.jpg")
-                img.save(filepath, 'JPEG')
-                screenshot_paths.append(filepath)
+            # Capture the whole article in one full-page screenshot
+            self.driver.execute_script("window.scrollTo(0, 0);")
+            result = self.driver.execute_cdp_cmd('Page.captureScreenshot', {
+                'format': 'png',
+                'captureBeyondViewport': True,
+                'fromSurface': True,
+                'clip': {
+                    'x': rect['x'],
+                    'y': rect['y'],
+                    'width': rect['width'],
+                    'height': rect['height'],
+                    'scale': 1
+                }
+            })
+            screenshot = base64.b64decode(result['data'])
+            logger.info(f"Captured article screenshot of height {rect['height']}")
+            
+            # Image.open only parses the header to get the size and mode
+            img = Image.open(BytesIO(screenshot))
+            if img.height <= page_height and img.mode in ('RGB', 'L'):
+                filepath = os.path.join(self.output_dir, "screenshot_000.png")
+                self._write_file(filepath, screenshot)
+                return [filepath]
+            
+            # Split long articles into pages; the image is decoded once and
+            # the pages are encoded in the background. Chrome screenshots are
+            # usually RGBA, which img2pdf cannot embed losslessly
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            
+            futures = []
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                for i, top in enumerate(range(0, img.height, page_height)):
+                    page = img.crop((0, top, img.width, min(top + page_height, img.height)))
+                    filepath = os.path.join(self.output_dir, f"screenshot_{i:03d}.png")
+                    futures.append(pool.submit(page.save, filepath, 'PNG'))
+                    screenshot_paths.append(filepath)
                 
-                logger.info(f"Captured screenshot at scroll position {i}")
+                # Surface any write errors before the paths are used
+                for future in futures:
+                    future.result()
             
+            logger.info(f"Split article screenshot into {len(screenshot_paths)} pages")
             return screenshot_paths
             
         except Exception as e:
             logger.error(f"Error capturing article screenshots: {e}")
             return []
     
+    @staticmethod
+    def _is_pdf_ready(img_path):
+        """
+        Check from the file header whether img2pdf can embed an image directly.
+        
+        Args:
+            img_path (str): Path to the image file
+            
+        Returns:
+            bool: True for JPEGs and for grayscale or RGB PNGs without alpha
+        """
+        with open(img_path, 'rb') as img_file:
+            header = img_file.read(26)
+        
+        if header[:3] == b'\xff\xd8\xff':
+            return True
+        
+        # The PNG color type is stored in the IHDR chunk; img2pdf refuses
+        # images with an alpha channel
+        if header[:8] == b'\x89PNG\r\n\x1a\n' and len(header) == 26:
+            return header[25] in (0, 2)
+        
+        return False
+    
     def create_pdf(self, image_paths):
         """
         Create a PDF file from the downloaded images.
@@ -354,9 +698,14 @@ class WeChatImageScraper:
         pdf_path = os.path.join(self.output_dir, self.pdf_name)
         
         try:
-            # Convert images to PDF-compatible format
-            converted_images = []
+            # Downloaded images and screenshots can be embedded by img2pdf
+            # as-is, only re-encode files that it cannot take directly
+            pdf_images = []
             for img_path in image_paths:
+                if self._is_pdf_ready(img_path):
+                    pdf_images.append(img_path)
+                    continue
+                
                 try:
                     # Open image, convert to RGB if needed
                     img = Image.open(img_path)
@@ -364,21 +713,23 @@ class WeChatImageScraper:
                         img = img.convert('RGB')
                     
                     # Save as temporary JPEG
-                    temp_path = img_path.replace('.jpg', '_temp.jpg')
+                    temp_path = os.path.splitext(img_path)[0] + '_temp.jpg'
                     img.save(temp_path, 'JPEG')
-                    converted_images.append(temp_path)
+                    pdf_images.append(temp_path)
                 except Exception as e:
                     logger.error(f"Error converting image {img_path}: {e}")
                     continue
             
-            # Create PDF
+            # Create PDF, streaming it to the file instead of building it in memory
             with open(pdf_path, "wb") as f:
-                f.write(img2pdf.convert(converted_images))
+                # Raw CDN JPEGs keep their EXIF data; ignore orientation tags
+                # img2pdf would otherwise reject instead of failing the whole PDF
+                img2pdf.convert(pdf_images, outputstream=f, rotation=img2pdf.Rotation.ifvalid)
             
             logger.info(f"Created PDF at {pdf_path}")
             
             # Clean up temporary files
-            for temp_img in converted_images:
+            for temp_img in pdf_images:
                 if os.path.exists(temp_img) and '_temp.jpg' in temp_img:
                     os.remove(temp_img)
             
@@ -407,10 +758,10 @@ class WeChatImageScraper:
                 return None
             
             # Extract image URLs using Selenium
-            image_urls = self.extract_images_with_selenium()
+            images = self.extract_images_with_selenium()
             
             # Download images
-            image_paths = self.download_images(image_urls)
+            image_paths = self.download_images(images)
             if not image_paths:
                 logger.error("Failed to download any images")
                 return None